@@ -7,11 +7,14 @@ Automated pre-launch validation for AxionAx Protocol testnet deployment
 import os
 import sys
 import json
+import mmap
+import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
 
 # ANSI color codes
@@ -23,6 +26,43 @@ CYAN = '\033[96m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Every sibling repository referenced by the checks
+KNOWN_REPOS = [
+    'axionax-core',
+    'axionax-sdk-ts',
+    'axionax-web',
+    'axionax-docs',
+    'axionax-deploy',
+    'axionax-devtools',
+    'axionax-marketplace'
+]
+
+# Category weights for the overall score, in report order
+CATEGORY_WEIGHTS: Tuple[Tuple[str, float], ...] = (
+    ('infrastructure', 0.15),
+    ('codebase', 0.20),
+    ('security', 0.25),  # Highest weight
+    ('performance', 0.15),
+    ('documentation', 0.10),
+    ('deployment', 0.10),
+    ('monitoring', 0.05)
+)
+
+# Section headers printed before each category's checks
+CATEGORY_HEADERS = {
+    'infrastructure': f"\n{BOLD}{BLUE}📦 INFRASTRUCTURE CHECKS{RESET}",
+    'codebase': f"\n{BOLD}{BLUE}💻 CODEBASE CHECKS{RESET}",
+    'security': f"\n{BOLD}{RED}🔒 SECURITY CHECKS (CRITICAL){RESET}",
+    'performance': f"\n{BOLD}{BLUE}⚡ PERFORMANCE CHECKS{RESET}",
+    'documentation': f"\n{BOLD}{BLUE}📚 DOCUMENTATION CHECKS{RESET}",
+    'deployment': f"\n{BOLD}{BLUE}🚀 DEPLOYMENT CHECKS{RESET}",
+    'monitoring': f"\n{BOLD}{BLUE}📊 MONITORING CHECKS{RESET}"
+}
+
+# Word tokens used for dependency/config lookups; hyphens and underscores
+# split tokens so e.g. tracing-subscriber and pino-http still match their base package
+TOKEN_PATTERN = re.compile(r'[A-Za-z][A-Za-z0-9]*')
+
 @dataclass
 class CheckResult:
     """Result of a single readiness check"""
@@ -39,8 +79,45 @@ class TestnetReadinessChecker:
     
     def __init__(self, workspace_root: Path):
         self.workspace_root = workspace_root
+        # Resolve repo paths once rather than re-joining them in every check
+        self._repo_paths: Dict[str, Path] = {repo: workspace_root / repo for repo in KNOWN_REPOS}
+        self._core_src = self._repo_paths['axionax-core'] / 'src'
         self.results: List[CheckResult] = []
+        self._categories: Dict[str, List[CheckResult]] = defaultdict(list)
+        self._category_scores: Dict[str, float] = {}
         self.start_time = None
+        self._token_cache: Dict[Path, set] = {}
+        # Directory listings, filled lazily so each directory is scanned at most once
+        self._listings: Dict[Path, Optional[Dict[str, set]]] = {}
+        
+        # Every check pre-bound once: (name, category, check, critical)
+        self._plan = [
+            ("Repository Structure", "infrastructure", self._check_repo_structure, False),
+            ("Git Configuration", "infrastructure", self._check_git_config, False),
+            ("Dependencies", "infrastructure", self._check_dependencies, False),
+            ("Build Tools", "infrastructure", self._check_build_tools, False),
+            ("Code Quality", "codebase", self._check_code_quality, False),
+            ("Test Coverage", "codebase", self._check_test_coverage, False),
+            ("Build Success", "codebase", self._check_build_success, False),
+            ("Linting", "codebase", self._check_linting, False),
+            ("No Hardcoded Secrets", "security", self._check_secrets, True),
+            ("Dependency Vulnerabilities", "security", self._check_vulnerabilities, True),
+            ("Security Audit Status", "security", self._check_audit_status, True),
+            ("Access Controls", "security", self._check_access_controls, False),
+            ("Benchmark Suite", "performance", self._check_benchmarks, False),
+            ("Build Optimization", "performance", self._check_optimization, False),
+            ("Load Testing", "performance", self._check_load_testing, False),
+            ("Core Documentation", "documentation", self._check_core_docs, False),
+            ("API Documentation", "documentation", self._check_api_docs, False),
+            ("Deployment Guides", "documentation", self._check_deployment_docs, False),
+            ("Examples", "documentation", self._check_examples, False),
+            ("Docker Configuration", "deployment", self._check_docker_config, False),
+            ("Environment Configs", "deployment", self._check_env_configs, False),
+            ("Deployment Scripts", "deployment", self._check_deployment_scripts, False),
+            ("Logging Configuration", "monitoring", self._check_logging, False),
+            ("Metrics Collection", "monitoring", self._check_metrics, False),
+            ("Health Checks", "monitoring", self._check_health_endpoints, False)
+        ]
         
     def run_all_checks(self) -> Tuple[bool, float]:
         """Run all readiness checks and return overall status"""
@@ -51,14 +128,13 @@ class TestnetReadinessChecker:
         print(f"{CYAN}{'='*70}{RESET}\n")
         print(f"⏰ Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         
-        # Run all check categories
-        self._check_infrastructure()
-        self._check_codebase()
-        self._check_security()
-        self._check_performance()
-        self._check_documentation()
-        self._check_deployment()
-        self._check_monitoring()
+        # Run all checks, printing a header whenever the category changes
+        current_category = None
+        for name, category, check_func, critical in self._plan:
+            if category != current_category:
+                print(CATEGORY_HEADERS[category])
+                current_category = category
+            self._run_check(name, category, check_func, critical)
         
         # Calculate overall results
         elapsed = time.time() - self.start_time
@@ -72,6 +148,18 @@ class TestnetReadinessChecker:
         
         return overall_passed, overall_score
     
+    def run_category(self, category: str) -> List[CheckResult]:
+        """Run only the checks of one category and return their results"""
+        if category not in CATEGORY_HEADERS:
+            raise ValueError(f"Unknown category: {category}")
+        
+        print(CATEGORY_HEADERS[category])
+        for name, check_category, check_func, critical in self._plan:
+            if check_category == category:
+                self._run_check(name, category, check_func, critical)
+        
+        return self._categories[category]
+    
     def _run_check(self, name: str, category: str, check_func, critical: bool = False):
         """Helper to run a single check and store result"""
         print(f"  🔍 Checking {name}...", end=' ')
@@ -89,6 +177,7 @@ class TestnetReadinessChecker:
                 critical=critical
             )
             self.results.append(result)
+            self._categories[category].append(result)
             
             icon = "✅" if passed else ("⚠️" if not critical else "❌")
             print(f"{icon} {message}")
@@ -103,25 +192,52 @@ class TestnetReadinessChecker:
                 critical=critical
             )
             self.results.append(result)
+            self._categories[category].append(result)
             print(f"❌ Error: {str(e)}")
     
+    def _listing(self, directory: Path) -> Optional[Dict[str, set]]:
+        """List a directory's file and subdirectory names once, or None if it is missing"""
+        if directory not in self._listings:
+            try:
+                entry = {'files': set(), 'dirs': set()}
+                with os.scandir(directory) as it:
+                    for item in it:
+                        entry['dirs' if item.is_dir() else 'files'].add(item.name)
+            except (FileNotFoundError, NotADirectoryError):
+                entry = None
+            self._listings[directory] = entry
+        return self._listings[directory]
+    
+    def _has_file(self, directory: Path, name: str) -> bool:
+        """Check for a file using the cached listing of its directory"""
+        entry = self._listing(directory)
+        return entry is not None and name in entry['files']
+    
+    def _has_dir(self, path: Path) -> bool:
+        """Check for a directory using the cached listing of its parent"""
+        entry = self._listing(path.parent)
+        return entry is not None and path.name in entry['dirs']
+    
+    def _find_rust_sources(self) -> List[Path]:
+        """Collect every .rs file under axionax-core/src"""
+        sources = []
+        for dirpath, _, filenames in os.walk(self._core_src):
+            sources.extend(Path(dirpath) / f for f in filenames if f.endswith('.rs'))
+        return sources
+    
+    def _file_tokens(self, path: Path) -> set:
+        """Tokenize a file once and cache the token set for later lookups"""
+        tokens = self._token_cache.get(path)
+        if tokens is None:
+            content = path.read_text(encoding='utf-8')
+            tokens = set(TOKEN_PATTERN.findall(content))
+            self._token_cache[path] = tokens
+        return tokens
+    
     # ========================================================================
     # CATEGORY 1: INFRASTRUCTURE CHECKS
     # ========================================================================
     
-    def _check_infrastructure(self):
-        """Check infrastructure readiness"""
-        print(f"\n{BOLD}{BLUE}📦 INFRASTRUCTURE CHECKS{RESET}")
-        
-        self._run_check("Repository Structure", "infrastructure", 
-                       self._check_repo_structure)
-        self._run_check("Git Configuration", "infrastructure",
-                       self._check_git_config)
-        self._run_check("Dependencies", "infrastructure",
-                       self._check_dependencies)
-        self._run_check("Build Tools", "infrastructure",
-                       self._check_build_tools)
-    
     def _check_repo_structure(self):
         """Verify all required repositories exist"""
         required_repos = [
@@ -137,8 +253,7 @@ class TestnetReadinessChecker:
         missing = []
         
         for repo in required_repos:
-            repo_path = self.workspace_root / repo
-            if repo_path.exists():
+            if self._has_dir(self._repo_paths[repo]):
                 found.append(repo)
             else:
                 missing.append(repo)
@@ -209,14 +324,14 @@ class TestnetReadinessChecker:
         tools = {}
         
         # Check Rust build
-        core_path = self.workspace_root / 'axionax-core'
-        if core_path.exists():
+        core_path = self._repo_paths['axionax-core']
+        if self._has_dir(core_path):
             tools['rust_build'] = self._check_command(['cargo', 'check'], cwd=core_path)
         
         # Check Node build
-        sdk_path = self.workspace_root / 'axionax-sdk-ts'
-        if sdk_path.exists() and (sdk_path / 'package.json').exists():
-            tools['node_build'] = (sdk_path / 'node_modules').exists()
+        sdk_path = self._repo_paths['axionax-sdk-ts']
+        if self._has_file(sdk_path, 'package.json'):
+            tools['node_build'] = self._has_dir(sdk_path / 'node_modules')
         
         score = (sum(1 for v in tools.values() if v) / max(len(tools), 1)) * 100
         
@@ -226,23 +341,10 @@ class TestnetReadinessChecker:
     # CATEGORY 2: CODEBASE CHECKS
     # ========================================================================
     
-    def _check_codebase(self):
-        """Check codebase quality and readiness"""
-        print(f"\n{BOLD}{BLUE}💻 CODEBASE CHECKS{RESET}")
-        
-        self._run_check("Code Quality", "codebase",
-                       self._check_code_quality)
-        self._run_check("Test Coverage", "codebase",
-                       self._check_test_coverage)
-        self._run_check("Build Success", "codebase",
-                       self._check_build_success)
-        self._run_check("Linting", "codebase",
-                       self._check_linting)
-    
     def _check_code_quality(self):
         """Check code quality metrics"""
         # Run quality analyzer if available
-        analyzer_path = self.workspace_root / 'axionax-devtools' / 'scripts' / 'analysis' / 'repo_quality_analyzer.py'
+        analyzer_path = self._repo_paths['axionax-devtools'] / 'scripts' / 'analysis' / 'repo_quality_analyzer.py'
         
         if not analyzer_path.exists():
             return False, 0, "Quality analyzer not found", None
@@ -275,7 +377,7 @@ class TestnetReadinessChecker:
     
     def _check_test_coverage(self):
         """Check test suite execution"""
-        test_runner = self.workspace_root / 'axionax-devtools' / 'run_all_tests.py'
+        test_runner = self._repo_paths['axionax-devtools'] / 'run_all_tests.py'
         
         if not test_runner.exists():
             return False, 0, "Test runner not found", None
@@ -315,8 +417,8 @@ class TestnetReadinessChecker:
         builds = {}
         
         # Check Rust build
-        core_path = self.workspace_root / 'axionax-core'
-        if core_path.exists():
+        core_path = self._repo_paths['axionax-core']
+        if self._has_dir(core_path):
             try:
                 result = subprocess.run(
                     ['cargo', 'build', '--release'],
@@ -330,8 +432,8 @@ class TestnetReadinessChecker:
         
         # Check TypeScript builds
         for project in ['axionax-sdk-ts', 'axionax-web']:
-            project_path = self.workspace_root / project
-            if project_path.exists() and (project_path / 'package.json').exists():
+            project_path = self._repo_paths[project]
+            if self._has_file(project_path, 'package.json'):
                 try:
                     result = subprocess.run(
                         ['npm', 'run', 'build'],
@@ -361,14 +463,10 @@ class TestnetReadinessChecker:
         
         # Check for linting configs
         for repo in ['axionax-core', 'axionax-sdk-ts', 'axionax-web']:
-            repo_path = self.workspace_root / repo
-            if repo_path.exists():
-                if (repo_path / 'clippy.toml').exists():
-                    lint_configs.append(f'{repo}/clippy.toml')
-                if (repo_path / '.eslintrc.json').exists():
-                    lint_configs.append(f'{repo}/.eslintrc.json')
-                if (repo_path / '.prettierrc').exists():
-                    lint_configs.append(f'{repo}/.prettierrc')
+            repo_path = self._repo_paths[repo]
+            for config in ['clippy.toml', '.eslintrc.json', '.prettierrc']:
+                if self._has_file(repo_path, config):
+                    lint_configs.append(f'{repo}/{config}')
         
         score = min(len(lint_configs) * 20, 100)
         
@@ -381,19 +479,6 @@ class TestnetReadinessChecker:
     # CATEGORY 3: SECURITY CHECKS (CRITICAL)
     # ========================================================================
     
-    def _check_security(self):
-        """Check security readiness"""
-        print(f"\n{BOLD}{RED}🔒 SECURITY CHECKS (CRITICAL){RESET}")
-        
-        self._run_check("No Hardcoded Secrets", "security",
-                       self._check_secrets, critical=True)
-        self._run_check("Dependency Vulnerabilities", "security",
-                       self._check_vulnerabilities, critical=True)
-        self._run_check("Security Audit Status", "security",
-                       self._check_audit_status, critical=True)
-        self._run_check("Access Controls", "security",
-                       self._check_access_controls)
-    
     def _check_secrets(self):
         """Check for hardcoded secrets"""
         # Common secret patterns
@@ -427,8 +512,8 @@ class TestnetReadinessChecker:
         findings = []
         
         for repo in ['axionax-core', 'axionax-sdk-ts', 'axionax-web', 'axionax-deploy', 'axionax-devtools']:
-            repo_path = self.workspace_root / repo
-            if not repo_path.exists():
+            repo_path = self._repo_paths[repo]
+            if not self._has_dir(repo_path):
                 continue
             
             for pattern in patterns:
@@ -476,8 +561,8 @@ class TestnetReadinessChecker:
         vulnerable = []
         
         for repo in ['axionax-sdk-ts', 'axionax-web', 'axionax-marketplace']:
-            repo_path = self.workspace_root / repo
-            if repo_path.exists() and (repo_path / 'package.json').exists():
+            repo_path = self._repo_paths[repo]
+            if self._has_file(repo_path, 'package.json'):
                 try:
                     result = subprocess.run(
                         ['npm', 'audit', '--json'],
@@ -520,8 +605,8 @@ class TestnetReadinessChecker:
         found_audits = []
         for filename in audit_files:
             for repo in ['axionax-core', 'axionax-docs']:
-                audit_path = self.workspace_root / repo / filename
-                if audit_path.exists():
+                if self._has_file(self._repo_paths[repo], filename):
+                    audit_path = self._repo_paths[repo] / filename
                     found_audits.append(str(audit_path.relative_to(self.workspace_root)))
         
         if found_audits:
@@ -535,8 +620,7 @@ class TestnetReadinessChecker:
         
         # Check for .gitignore
         for repo in ['axionax-core', 'axionax-sdk-ts', 'axionax-web', 'axionax-deploy']:
-            gitignore = self.workspace_root / repo / '.gitignore'
-            if gitignore.exists():
+            if self._has_file(self._repo_paths[repo], '.gitignore'):
                 configs.append(f'{repo}/.gitignore')
         
         score = min(len(configs) * 25, 100)
@@ -547,24 +631,13 @@ class TestnetReadinessChecker:
     # CATEGORY 4: PERFORMANCE CHECKS
     # ========================================================================
     
-    def _check_performance(self):
-        """Check performance readiness"""
-        print(f"\n{BOLD}{BLUE}⚡ PERFORMANCE CHECKS{RESET}")
-        
-        self._run_check("Benchmark Suite", "performance",
-                       self._check_benchmarks)
-        self._run_check("Build Optimization", "performance",
-                       self._check_optimization)
-        self._run_check("Load Testing", "performance",
-                       self._check_load_testing)
-    
     def _check_benchmarks(self):
         """Check for performance benchmarks"""
         bench_files = []
         
         # Check Rust benchmarks
-        core_benches = self.workspace_root / 'axionax-core' / 'benches'
-        if core_benches.exists():
+        core_benches = self._repo_paths['axionax-core'] / 'benches'
+        if self._has_dir(core_benches):
             bench_files.extend(list(core_benches.glob('*.rs')))
         
         # Check for benchmark results
@@ -585,16 +658,16 @@ class TestnetReadinessChecker:
         optimizations = []
         
         # Check Rust release profile
-        core_cargo = self.workspace_root / 'axionax-core' / 'Cargo.toml'
-        if core_cargo.exists():
+        core_cargo = self._repo_paths['axionax-core'] / 'Cargo.toml'
+        if self._has_file(self._repo_paths['axionax-core'], 'Cargo.toml'):
             content = core_cargo.read_text(encoding='utf-8')
             if '[profile.release]' in content and 'opt-level = 3' in content:
                 optimizations.append('rust_release_profile')
         
         # Check TypeScript optimization
         for repo in ['axionax-sdk-ts', 'axionax-web']:
-            tsconfig = self.workspace_root / repo / 'tsconfig.json'
-            if tsconfig.exists():
+            tsconfig = self._repo_paths[repo] / 'tsconfig.json'
+            if self._has_file(self._repo_paths[repo], 'tsconfig.json'):
                 content = tsconfig.read_text(encoding='utf-8')
                 if 'ES2021' in content or 'ESNext' in content:
                     optimizations.append(f'{repo}_tsconfig')
@@ -619,19 +692,6 @@ class TestnetReadinessChecker:
     # CATEGORY 5: DOCUMENTATION CHECKS
     # ========================================================================
     
-    def _check_documentation(self):
-        """Check documentation completeness"""
-        print(f"\n{BOLD}{BLUE}📚 DOCUMENTATION CHECKS{RESET}")
-        
-        self._run_check("Core Documentation", "documentation",
-                       self._check_core_docs)
-        self._run_check("API Documentation", "documentation",
-                       self._check_api_docs)
-        self._run_check("Deployment Guides", "documentation",
-                       self._check_deployment_docs)
-        self._run_check("Examples", "documentation",
-                       self._check_examples)
-    
     def _check_core_docs(self):
         """Check core documentation files"""
         required_docs = [
@@ -645,8 +705,7 @@ class TestnetReadinessChecker:
         
         for doc in required_docs:
             for repo in ['axionax-core', 'axionax-docs']:
-                doc_path = self.workspace_root / repo / doc
-                if doc_path.exists():
+                if self._has_file(self._repo_paths[repo], doc):
                     found_docs.append(doc)
                     break
         
@@ -663,12 +722,11 @@ class TestnetReadinessChecker:
         api_docs = []
         
         for repo in ['axionax-core', 'axionax-docs', 'axionax-sdk-ts']:
-            api_path = self.workspace_root / repo / 'docs' / 'API_REFERENCE.md'
-            if not api_path.exists():
-                api_path = self.workspace_root / repo / 'API_REFERENCE.md'
-            
-            if api_path.exists():
-                api_docs.append(str(api_path.relative_to(self.workspace_root)))
+            for api_dir in [self._repo_paths[repo] / 'docs', self._repo_paths[repo]]:
+                if self._has_file(api_dir, 'API_REFERENCE.md'):
+                    api_path = api_dir / 'API_REFERENCE.md'
+                    api_docs.append(str(api_path.relative_to(self.workspace_root)))
+                    break
         
         score = min(len(api_docs) * 50, 100)
         
@@ -680,8 +738,8 @@ class TestnetReadinessChecker:
         
         for repo in ['axionax-deploy', 'axionax-docs']:
             for doc_name in ['DEPLOYMENT_GUIDE.md', 'DEPLOYMENT.md', 'VPS_VALIDATOR_SETUP.md']:
-                doc_path = self.workspace_root / repo / doc_name
-                if doc_path.exists():
+                doc_path = self._repo_paths[repo] / doc_name
+                if self._has_file(self._repo_paths[repo], doc_name):
                     deployment_docs.append(str(doc_path.relative_to(self.workspace_root)))
         
         score = min(len(deployment_docs) * 40, 100)
@@ -693,8 +751,8 @@ class TestnetReadinessChecker:
         example_dirs = []
         
         for repo in ['axionax-core', 'axionax-sdk-ts']:
-            examples_path = self.workspace_root / repo / 'examples'
-            if examples_path.exists() and examples_path.is_dir():
+            examples_path = self._repo_paths[repo] / 'examples'
+            if self._has_dir(examples_path):
                 example_files = list(examples_path.glob('*.*'))
                 if example_files:
                     example_dirs.append({
@@ -711,29 +769,14 @@ class TestnetReadinessChecker:
     # CATEGORY 6: DEPLOYMENT CHECKS
     # ========================================================================
     
-    def _check_deployment(self):
-        """Check deployment readiness"""
-        print(f"\n{BOLD}{BLUE}🚀 DEPLOYMENT CHECKS{RESET}")
-        
-        self._run_check("Docker Configuration", "deployment",
-                       self._check_docker_config)
-        self._run_check("Environment Configs", "deployment",
-                       self._check_env_configs)
-        self._run_check("Deployment Scripts", "deployment",
-                       self._check_deployment_scripts)
-    
     def _check_docker_config(self):
         """Check Docker configuration"""
         docker_files = []
         
         for repo in ['axionax-core', 'axionax-web', 'axionax-deploy']:
-            dockerfile = self.workspace_root / repo / 'Dockerfile'
-            if dockerfile.exists():
-                docker_files.append(f'{repo}/Dockerfile')
-            
-            compose = self.workspace_root / repo / 'docker-compose.yml'
-            if compose.exists():
-                docker_files.append(f'{repo}/docker-compose.yml')
+            for docker_file in ['Dockerfile', 'docker-compose.yml']:
+                if self._has_file(self._repo_paths[repo], docker_file):
+                    docker_files.append(f'{repo}/{docker_file}')
         
         score = min(len(docker_files) * 20, 100)
         
@@ -744,12 +787,10 @@ class TestnetReadinessChecker:
         env_configs = []
         
         for repo in ['axionax-core', 'axionax-web', 'axionax-deploy']:
-            repo_path = self.workspace_root / repo
-            if repo_path.exists():
-                for env_file in ['.env.example', '.env.testnet', 'config.testnet.toml']:
-                    env_path = repo_path / env_file
-                    if env_path.exists():
-                        env_configs.append(f'{repo}/{env_file}')
+            repo_path = self._repo_paths[repo]
+            for env_file in ['.env.example', '.env.testnet', 'config.testnet.toml']:
+                if self._has_file(repo_path, env_file):
+                    env_configs.append(f'{repo}/{env_file}')
         
         score = min(len(env_configs) * 25, 100)
         
@@ -759,11 +800,10 @@ class TestnetReadinessChecker:
         """Check deployment automation scripts"""
         scripts = []
         
-        deploy_path = self.workspace_root / 'axionax-deploy'
-        if deploy_path.exists():
+        deploy_path = self._repo_paths['axionax-deploy']
+        if self._has_dir(deploy_path):
             for script_name in ['setup_rpc_node.sh', 'setup_validator.sh', 'setup_faucet.sh', 'setup_explorer.sh']:
-                script_path = deploy_path / script_name
-                if script_path.exists():
+                if self._has_file(deploy_path, script_name):
                     scripts.append(script_name)
         
         score = min(len(scripts) * 25, 100)
@@ -774,37 +814,24 @@ class TestnetReadinessChecker:
     # CATEGORY 7: MONITORING CHECKS
     # ========================================================================
     
-    def _check_monitoring(self):
-        """Check monitoring and observability"""
-        print(f"\n{BOLD}{BLUE}📊 MONITORING CHECKS{RESET}")
-        
-        self._run_check("Logging Configuration", "monitoring",
-                       self._check_logging)
-        self._run_check("Metrics Collection", "monitoring",
-                       self._check_metrics)
-        self._run_check("Health Checks", "monitoring",
-                       self._check_health_endpoints)
-    
     def _check_logging(self):
         """Check logging configuration"""
         # Look for logging configs
         log_configs = []
         
         for repo in ['axionax-core', 'axionax-web']:
-            repo_path = self.workspace_root / repo
-            if repo_path.exists():
+            repo_path = self._repo_paths[repo]
+            if self._has_dir(repo_path):
                 # Check Rust logging
                 cargo = repo_path / 'Cargo.toml'
-                if cargo.exists():
-                    content = cargo.read_text(encoding='utf-8')
-                    if 'log' in content or 'tracing' in content:
+                if self._has_file(repo_path, 'Cargo.toml'):
+                    if self._file_tokens(cargo) & {'log', 'tracing'}:
                         log_configs.append(f'{repo}/Cargo.toml (logging)')
                 
                 # Check Node logging
                 package = repo_path / 'package.json'
-                if package.exists():
-                    content = package.read_text(encoding='utf-8')
-                    if 'winston' in content or 'pino' in content:
+                if self._has_file(repo_path, 'package.json'):
+                    if self._file_tokens(package) & {'winston', 'pino'}:
                         log_configs.append(f'{repo}/package.json (logging)')
         
         score = min(len(log_configs) * 50, 100)
@@ -817,11 +844,10 @@ class TestnetReadinessChecker:
         metrics_files = []
         
         for repo in ['axionax-core', 'axionax-deploy']:
-            repo_path = self.workspace_root / repo
-            if repo_path.exists():
+            repo_path = self._repo_paths[repo]
+            if self._has_dir(repo_path):
                 for metrics_file in ['prometheus.yml', 'metrics.toml', 'grafana-dashboard.json']:
-                    metrics_path = repo_path / metrics_file
-                    if metrics_path.exists():
+                    if self._has_file(repo_path, metrics_file):
                         metrics_files.append(f'{repo}/{metrics_file}')
         
         score = min(len(metrics_files) * 50, 100)
@@ -837,13 +863,17 @@ class TestnetReadinessChecker:
         health_checks = []
         
         # Check in core
-        core_src = self.workspace_root / 'axionax-core' / 'src'
-        if core_src.exists():
-            for rs_file in core_src.rglob('*.rs'):
-                content = rs_file.read_text(encoding='utf-8', errors='ignore')
-                if '/health' in content or 'health_check' in content:
-                    health_checks.append(str(rs_file.relative_to(self.workspace_root)))
-                    break
+        for rs_file in self._find_rust_sources():
+            # mmap + bytes.find avoids decoding large sources into str
+            with open(rs_file, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    continue  # Empty files cannot be mapped
+                with mm:
+                    if mm.find(b'/health') != -1 or mm.find(b'health_check') != -1:
+                        health_checks.append(str(rs_file.relative_to(self.workspace_root)))
+                        break
         
         score = min(len(health_checks) * 100, 100)
         
@@ -871,33 +901,17 @@ class TestnetReadinessChecker:
         if not self.results:
             return False, 0
         
-        # Categorize results
-        categories = {}
-        for result in self.results:
-            if result.category not in categories:
-                categories[result.category] = []
-            categories[result.category].append(result)
-        
-        # Calculate category scores
+        # Calculate category scores (cached for the summary)
         category_scores = {}
-        for category, results in categories.items():
+        for category, results in self._categories.items():
             avg_score = sum(r.score for r in results) / len(results)
             category_scores[category] = avg_score
+        self._category_scores = category_scores
         
         # Overall score (weighted average)
-        weights = {
-            'infrastructure': 0.15,
-            'codebase': 0.20,
-            'security': 0.25,  # Highest weight
-            'performance': 0.15,
-            'documentation': 0.10,
-            'deployment': 0.10,
-            'monitoring': 0.05
-        }
-        
         overall_score = sum(
-            category_scores.get(cat, 0) * weight
-            for cat, weight in weights.items()
+            category_scores.get(cat, 0.0) * weight
+            for cat, weight in CATEGORY_WEIGHTS
         )
         
         # Check critical requirements
@@ -928,20 +942,13 @@ class TestnetReadinessChecker:
         print(f"  ⏱️  Execution Time: {elapsed:.2f}s\n")
         
         # Category breakdown
-        categories = {}
-        for result in self.results:
-            if result.category not in categories:
-                categories[result.category] = []
-            categories[result.category].append(result)
-        
         print(f"{BOLD}Category Scores:{RESET}")
-        for category in ['infrastructure', 'codebase', 'security', 'performance', 
-                        'documentation', 'deployment', 'monitoring']:
-            if category not in categories:
+        for category, _ in CATEGORY_WEIGHTS:
+            if category not in self._category_scores:
                 continue
             
-            results = categories[category]
-            avg_score = sum(r.score for r in results) / len(results)
+            results = self._categories[category]
+            avg_score = self._category_scores[category]
             passed = sum(1 for r in results if r.passed)
             total = len(results)
             
@@ -980,18 +987,36 @@ class TestnetReadinessChecker:
         
         print(f"\n{CYAN}{'='*70}{RESET}\n")
     
+    @staticmethod
+    def _result_to_dict(result: CheckResult) -> Dict:
+        """Convert a check result to a dict without asdict's recursive deepcopy"""
+        return {
+            'name': result.name,
+            'category': result.category,
+            'passed': result.passed,
+            'score': result.score,
+            'message': result.message,
+            'details': result.details,
+            'critical': result.critical
+        }
+    
     def _save_report(self, overall_passed: bool, overall_score: float):
-        """Save JSON report"""
-        report = {
+        """Save JSON report, streaming one compact result per line"""
+        header = {
             'timestamp': datetime.now().isoformat(),
             'overall_passed': overall_passed,
-            'overall_score': round(overall_score, 2),
-            'results': [asdict(r) for r in self.results]
+            'overall_score': round(overall_score, 2)
         }
         
         report_path = self.workspace_root / 'TESTNET_READINESS_REPORT.json'
         with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+            # Reuse the header encoding and splice the results array in before the closing brace
+            f.write(json.dumps(header)[:-1])
+            f.write(', "results": [')
+            for i, result in enumerate(self.results):
+                f.write(',\n  ' if i else '\n  ')
+                f.write(json.dumps(self._result_to_dict(result), separators=(',', ':')))
+            f.write('\n]}\n')
         
         print(f"📄 Detailed report saved: {report_path.name}\n")
 
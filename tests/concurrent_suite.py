@@ -0,0 +1,25 @@
+"""
+Shared suite builder for the axionax DevTools test modules
+Fans independent test classes out across processes when the platform allows it
+"""
+
+import os
+import unittest
+from types import ModuleType
+
+try:
+    from concurrencytest import ConcurrentTestSuite, fork_for_tests
+    CONCURRENCY_AVAILABLE = True
+except ImportError:
+    CONCURRENCY_AVAILABLE = False
+
+
+def build_suite(module: ModuleType) -> unittest.TestSuite:
+    """Load every test class defined in module, forking workers where supported"""
+    suite = unittest.TestLoader().loadTestsFromModule(module)
+
+    # fork_for_tests needs os.fork, which Windows does not provide
+    if CONCURRENCY_AVAILABLE and hasattr(os, 'fork'):
+        suite = ConcurrentTestSuite(suite, fork_for_tests(os.cpu_count() or 1))
+
+    return suite
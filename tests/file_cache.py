@@ -0,0 +1,43 @@
+"""
+Shared file discovery and read cache for the axionax DevTools test suite
+Imported by several test modules so each file is walked and read once per run
+"""
+
+import functools
+import os
+from typing import Iterator, Tuple
+
+
+# Directories never worth descending into when looking for sources
+PRUNED_DIRS = ('__pycache__', '.git', 'node_modules', '.venv')
+
+
+def iter_py_files(root: str) -> Iterator[str]:
+    """Yield *.py paths under root, pruning cache/VCS/dependency directories"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in PRUNED_DIRS]
+        for filename in filenames:
+            if filename.endswith('.py'):
+                yield os.path.join(dirpath, filename)
+
+
+@functools.lru_cache(maxsize=None)
+def all_py_files(root: str) -> Tuple[str, ...]:
+    """Walk the tree once per run and return every *.py path as a string"""
+    return tuple(iter_py_files(root))
+
+
+@functools.lru_cache(maxsize=4096)
+def read_bytes(path: str) -> bytes:
+    """Read a file from disk once and share the raw bytes across tests
+
+    The cache lives in the calling process; process-pool workers should be
+    handed the bytes rather than calling this themselves.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def file_text(path: str) -> str:
+    """Decode a cached file as UTF-8"""
+    return read_bytes(path).decode('utf-8')
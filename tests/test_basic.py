@@ -5,13 +5,23 @@ Tests core functionality, file operations, and utility functions
 """
 
 import unittest
+import mmap
 import os
+import re
 import sys
 from pathlib import Path
 
+try:
+    from tests.concurrent_suite import build_suite
+except ImportError:
+    from concurrent_suite import build_suite
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Markdown title lines mentioning the AxionAX spelling
+BRANDED_TITLE_PATTERN = re.compile(r'^(#[^\n]*AxionAX[^\n]*)$', re.MULTILINE)
+
 
 class TestFileOperations(unittest.TestCase):
     """Test file and directory operations"""
@@ -20,6 +30,7 @@ class TestFileOperations(unittest.TestCase):
         """Set up test environment"""
         self.test_dir = Path(__file__).parent
         self.root_dir = self.test_dir.parent
+        self._root_entries = set(os.listdir(self.root_dir))
         
     def test_workspace_structure(self):
         """Test that workspace has correct structure"""
@@ -43,8 +54,7 @@ class TestFileOperations(unittest.TestCase):
             "install_dependencies_macos.sh"
         ]
         for script in scripts:
-            script_path = self.root_dir / script
-            self.assertTrue(script_path.exists(), f"{script} should exist")
+            self.assertIn(script, self._root_entries, f"{script} should exist")
 
 
 class TestRepositoryStructure(unittest.TestCase):
@@ -75,11 +85,12 @@ class TestRepositoryStructure(unittest.TestCase):
         """Test that essential scripts exist"""
         scripts_dir = self.root_dir / "scripts"
         if scripts_dir.exists():
+            with os.scandir(scripts_dir) as it:
+                entries = {entry.name: entry for entry in it}
             subdirs = ["testing", "fixing", "analysis"]
             for subdir in subdirs:
-                subdir_path = scripts_dir / subdir
-                if subdir_path.exists():
-                    self.assertTrue(subdir_path.is_dir(), f"scripts/{subdir} should be a directory")
+                if subdir in entries:
+                    self.assertTrue(entries[subdir].is_dir(), f"scripts/{subdir} should be a directory")
 
 
 class TestToolsAvailability(unittest.TestCase):
@@ -120,9 +131,12 @@ class TestDocumentation(unittest.TestCase):
         """Test that README uses correct branding"""
         readme = self.root_dir / "README.md"
         if readme.exists():
-            content = readme.read_text(encoding='utf-8')
-            # Should use lowercase 'axionax', not 'AxionAX' or 'Axionax'
-            self.assertIn("axionax", content.lower())
+            # An empty file cannot be mapped, and must fail the branding check anyway
+            self.assertGreater(readme.stat().st_size, 0, "README.md should not be empty")
+            # Scan the mapped bytes directly; no need to decode the whole file
+            with open(readme, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Should use lowercase 'axionax', not 'AxionAX' or 'Axionax'
+                self.assertIsNotNone(re.search(rb'axionax', mm, re.IGNORECASE))
             
     def test_no_broken_branding(self):
         """Test that there are no incorrect branding variations"""
@@ -130,26 +144,21 @@ class TestDocumentation(unittest.TestCase):
         if readme.exists():
             content = readme.read_text(encoding='utf-8')
             # Check for common mistakes (case-sensitive check on title lines)
-            lines = content.split('\n')
-            for i, line in enumerate(lines):
+            for match in BRANDED_TITLE_PATTERN.finditer(content):
+                line = match.group(1)
                 # Allow AxionAX in URLs and specific contexts
-                if line.startswith('#') and 'github.com' not in line:
-                    # Title lines should not have AxionAX
-                    if 'AxionAX' in line and 'axionax' not in line.lower():
-                        self.fail(f"Line {i+1}: Found 'AxionAX' in title: {line}")
+                if 'github.com' in line:
+                    continue
+                # Title lines should not have AxionAX
+                if 'axionax' not in line.lower():
+                    line_no = content.count('\n', 0, match.start()) + 1
+                    self.fail(f"Line {line_no}: Found 'AxionAX' in title: {line}")
 
 
 def run_tests():
     """Run all tests and return results"""
     # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestFileOperations))
-    suite.addTests(loader.loadTestsFromTestCase(TestRepositoryStructure))
-    suite.addTests(loader.loadTestsFromTestCase(TestToolsAvailability))
-    suite.addTests(loader.loadTestsFromTestCase(TestDocumentation))
+    suite = build_suite(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
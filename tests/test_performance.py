@@ -5,11 +5,41 @@ Tests performance characteristics and build processes
 """
 
 import unittest
+import mmap
 import os
 import sys
 from pathlib import Path
 import time
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from tests.concurrent_suite import build_suite
+    from tests.file_cache import all_py_files, file_text, iter_py_files, read_bytes
+except ImportError:
+    from concurrent_suite import build_suite
+    from file_cache import all_py_files, file_text, iter_py_files, read_bytes
+
+
+# Git merge conflict markers, matched as raw bytes
+CONFLICT_MARKERS = (b'<<<<<<', b'>>>>>>')
+
+
+def _find_conflict_marker(data):
+    """Return the first conflict marker found in a bytes-like buffer, or None"""
+    for marker in CONFLICT_MARKERS:
+        if data.find(marker) != -1:
+            return marker
+    return None
+
+
+def _check_syntax(path: str, source: bytes):
+    """Compile a single file's source, returning (path, error message or None)"""
+    try:
+        compile(source, os.path.basename(path), 'exec')
+    except SyntaxError as e:
+        return path, f"{os.path.basename(path)}: {e}"
+    return path, None
 
 
 class TestPerformance(unittest.TestCase):
@@ -23,8 +53,8 @@ class TestPerformance(unittest.TestCase):
         """Test that file operations are reasonably fast"""
         start_time = time.time()
         
-        # Count all Python files
-        python_files = list(self.devtools_dir.rglob("*.py"))
+        # Count all Python files, walking the tree rather than hitting the cache
+        python_files = tuple(iter_py_files(str(self.devtools_dir)))
         
         elapsed = time.time() - start_time
         
@@ -41,7 +71,7 @@ class TestPerformance(unittest.TestCase):
         start_time = time.time()
         
         # Read and parse README
-        content = readme.read_text(encoding='utf-8')
+        content = file_text(str(readme))
         lines = content.split('\n')
         
         elapsed = time.time() - start_time
@@ -61,18 +91,13 @@ class TestBuildProcesses(unittest.TestCase):
         
     def test_python_syntax_validation(self):
         """Test that all Python files have valid syntax"""
-        python_files = list(self.devtools_dir.rglob("*.py"))
+        python_files = all_py_files(str(self.devtools_dir))
         
-        syntax_errors = []
-        for py_file in python_files:
-            if '__pycache__' in str(py_file):
-                continue
-                
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    compile(f.read(), py_file.name, 'exec')
-            except SyntaxError as e:
-                syntax_errors.append(f"{py_file.name}: {e}")
+        # Compiling is CPU-bound, so spread it across processes; sources come
+        # from this process's read cache so workers don't re-read the files
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_check_syntax, python_files, map(read_bytes, python_files), chunksize=4))
+        syntax_errors = [error for _, error in results if error]
                 
         self.assertEqual(len(syntax_errors), 0, f"Found syntax errors: {syntax_errors}")
         
@@ -108,14 +133,12 @@ class TestScriptIntegrity(unittest.TestCase):
         
         for ps_script in ps_scripts:
             try:
-                content = ps_script.read_text(encoding='utf-8')
-                
                 # Basic checks
-                self.assertGreater(len(content), 0, f"{ps_script.name} should not be empty")
+                self.assertGreater(ps_script.stat().st_size, 0, f"{ps_script.name} should not be empty")
                 
-                # Should not have obvious syntax errors
-                self.assertNotIn('<<<<<<', content, f"{ps_script.name} has merge conflict markers")
-                self.assertNotIn('>>>>>>', content, f"{ps_script.name} has merge conflict markers")
+                with open(ps_script, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Should not have obvious syntax errors
+                    self.assertIsNone(_find_conflict_marker(mm), f"{ps_script.name} has merge conflict markers")
             except Exception as e:
                 self.fail(f"Error reading {ps_script.name}: {e}")
                 
@@ -125,21 +148,18 @@ class TestScriptIntegrity(unittest.TestCase):
         
         for sh_script in sh_scripts:
             try:
-                content = sh_script.read_text(encoding='utf-8')
-                
                 # Basic checks
-                self.assertGreater(len(content), 0, f"{sh_script.name} should not be empty")
+                self.assertGreater(sh_script.stat().st_size, 0, f"{sh_script.name} should not be empty")
                 
-                # Should start with shebang
-                first_line = content.split('\n')[0]
-                self.assertTrue(
-                    first_line.startswith('#!'),
-                    f"{sh_script.name} should have shebang"
-                )
-                
-                # Should not have merge conflicts
-                self.assertNotIn('<<<<<<', content, f"{sh_script.name} has merge conflict markers")
-                self.assertNotIn('>>>>>>', content, f"{sh_script.name} has merge conflict markers")
+                with open(sh_script, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Should start with shebang
+                    self.assertTrue(
+                        mm[:2] == b'#!',
+                        f"{sh_script.name} should have shebang"
+                    )
+                    
+                    # Should not have merge conflicts
+                    self.assertIsNone(_find_conflict_marker(mm), f"{sh_script.name} has merge conflict markers")
             except Exception as e:
                 self.fail(f"Error reading {sh_script.name}: {e}")
 
@@ -203,14 +223,8 @@ class TestCrossRepositoryIntegration(unittest.TestCase):
 
 def run_performance_tests():
     """Run all performance tests"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestPerformance))
-    suite.addTests(loader.loadTestsFromTestCase(TestBuildProcesses))
-    suite.addTests(loader.loadTestsFromTestCase(TestScriptIntegrity))
-    suite.addTests(loader.loadTestsFromTestCase(TestCrossRepositoryIntegration))
+    # Create test suite
+    suite = build_suite(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
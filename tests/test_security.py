@@ -8,8 +8,63 @@ import unittest
 import os
 import sys
 from pathlib import Path
+from typing import List
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from tests.concurrent_suite import build_suite
+    from tests.file_cache import all_py_files, file_text, read_bytes
+except ImportError:
+    from concurrent_suite import build_suite
+    from file_cache import all_py_files, file_text, read_bytes
+
+
+# Patterns that might indicate secrets, combined into one pass
+SECRET_PATTERN = re.compile(b'|'.join(b'(?:' + p + b')' for p in [
+    rb'password\s*=\s*["\'][^"\']{8,}["\']',
+    rb'api[_-]?key\s*=\s*["\'][^"\']{20,}["\']',
+    rb'secret\s*=\s*["\'][^"\']{20,}["\']',
+    rb'token\s*=\s*["\'][^"\']{20,}["\']',
+]), re.IGNORECASE)
+
+# Markdown links: [text](url)
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+
+# File extensions that legitimately appear in GitHub /blob/ links
+DOC_EXTENSIONS = ('.md', '.txt', '.json', '.yml')
+
+
+def _scan_secrets(path: str, content: bytes) -> List[str]:
+    """Return potential hardcoded secrets found in a single file's content"""
+    issues = []
+    try:
+        for match in SECRET_PATTERN.finditer(content):
+            # Skip examples and test data
+            matched = match.group().lower()
+            if b'example' not in matched and b'test' not in matched:
+                issues.append(f"{os.path.basename(path)}: {match.group().decode('utf-8', 'replace')}")
+    except:
+        pass
+    return issues
+
+
+def _scan_prints(path: str, content: bytes) -> List[str]:
+    """Return file:line locations of top-level print() calls in a single file's content"""
+    locations = []
+    try:
+        lines = content.decode('utf-8').split('\n')
+        
+        for i, line in enumerate(lines):
+            # Look for print() not in comments or strings
+            if 'print(' in line:
+                stripped = line.strip()
+                if stripped.startswith('print(') and not stripped.startswith('#'):
+                    locations.append(f"{os.path.basename(path)}:{i+1}")
+    except:
+        pass
+    return locations
 
 
 class TestSecurityPractices(unittest.TestCase):
@@ -22,31 +77,17 @@ class TestSecurityPractices(unittest.TestCase):
         
     def test_no_hardcoded_secrets(self):
         """Test that there are no hardcoded secrets in Python files"""
-        python_files = list(self.devtools_dir.rglob("*.py"))
-        
-        # Patterns that might indicate secrets
-        secret_patterns = [
-            r'password\s*=\s*["\'][^"\']{8,}["\']',
-            r'api[_-]?key\s*=\s*["\'][^"\']{20,}["\']',
-            r'secret\s*=\s*["\'][^"\']{20,}["\']',
-            r'token\s*=\s*["\'][^"\']{20,}["\']',
+        python_files = [
+            f for f in all_py_files(str(self.devtools_dir))
+            if 'test_' not in os.path.basename(f)
         ]
         
-        found_issues = []
-        for py_file in python_files:
-            if 'test_' in py_file.name or '__pycache__' in str(py_file):
-                continue
-                
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                for pattern in secret_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        # Skip examples and test data
-                        if 'example' not in match.group().lower() and 'test' not in match.group().lower():
-                            found_issues.append(f"{py_file.name}: {match.group()}")
-            except:
-                pass
+        with ProcessPoolExecutor() as executor:
+            found_issues = [
+                issue
+                for issues in executor.map(_scan_secrets, python_files, map(read_bytes, python_files), chunksize=4)
+                for issue in issues
+            ]
                 
         self.assertEqual(len(found_issues), 0, f"Found potential secrets: {found_issues}")
         
@@ -60,10 +101,11 @@ class TestSecurityPractices(unittest.TestCase):
         
         for script in scripts:
             if script.exists():
-                # Check if file has shebang
-                first_line = script.read_text(encoding='utf-8').split('\n')[0]
+                # Check if file has shebang (only the first two bytes matter)
+                with open(script, 'rb') as f:
+                    head = f.read(2)
                 self.assertTrue(
-                    first_line.startswith('#!'),
+                    head == b'#!',
                     f"{script.name} should have shebang line"
                 )
                 
@@ -99,17 +141,14 @@ class TestConfigurationFiles(unittest.TestCase):
                 
     def test_python_files_have_utf8_encoding(self):
         """Test that Python files use UTF-8 encoding"""
-        python_files = list(self.devtools_dir.rglob("*.py"))
+        python_files = all_py_files(str(self.devtools_dir))
         
         for py_file in python_files:
-            if '__pycache__' in str(py_file):
-                continue
-                
             try:
                 # Try to read with UTF-8
-                py_file.read_text(encoding='utf-8')
+                file_text(py_file)
             except UnicodeDecodeError:
-                self.fail(f"{py_file.name} cannot be read as UTF-8")
+                self.fail(f"{os.path.basename(py_file)} cannot be read as UTF-8")
 
 
 class TestDependencies(unittest.TestCase):
@@ -170,7 +209,7 @@ class TestDocumentationQuality(unittest.TestCase):
         """Test that README has essential sections"""
         readme = self.devtools_dir / "README.md"
         if readme.exists():
-            content = readme.read_text(encoding='utf-8').lower()
+            content = file_text(str(readme)).lower()
             
             essential_sections = [
                 'installation',
@@ -189,7 +228,7 @@ class TestDocumentationQuality(unittest.TestCase):
         """Test that README has proper GitHub links"""
         readme = self.devtools_dir / "README.md"
         if readme.exists():
-            content = readme.read_text(encoding='utf-8')
+            content = file_text(str(readme))
             
             # Should have GitHub links
             self.assertIn('github.com', content)
@@ -199,18 +238,18 @@ class TestDocumentationQuality(unittest.TestCase):
         """Test that there are no obviously broken markdown links"""
         readme = self.devtools_dir / "README.md"
         if readme.exists():
-            content = readme.read_text(encoding='utf-8')
+            content = file_text(str(readme))
             
             # Find markdown links: [text](url)
-            link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-            matches = re.finditer(link_pattern, content)
+            matches = MARKDOWN_LINK_PATTERN.finditer(content)
             
             for match in matches:
                 url = match.group(2)
                 # Check for common mistakes
                 if url.startswith('http'):
                     # Should not have /blob/ for GitHub tree links
-                    if '/blob/' in url and not any(ext in url for ext in ['.md', '.txt', '.json', '.yml']):
+                    file_part = url.partition('#')[0].partition('?')[0]
+                    if '/blob/' in url and not file_part.endswith(DOC_EXTENSIONS):
                         self.fail(f"Found /blob/ in non-file link: {url}")
 
 
@@ -223,15 +262,15 @@ class TestCodeQuality(unittest.TestCase):
         
     def test_python_files_have_docstrings(self):
         """Test that Python modules have docstrings"""
-        python_files = list(self.devtools_dir.rglob("*.py"))
+        python_files = all_py_files(str(self.devtools_dir))
         
         files_without_docstring = []
         for py_file in python_files:
-            if '__pycache__' in str(py_file) or '__init__' in py_file.name:
+            if '__init__' in os.path.basename(py_file):
                 continue
                 
             try:
-                content = py_file.read_text(encoding='utf-8')
+                content = file_text(py_file)
                 lines = content.split('\n')
                 
                 # Check first 10 lines for docstring
@@ -242,7 +281,7 @@ class TestCodeQuality(unittest.TestCase):
                         break
                         
                 if not has_docstring and len(content.strip()) > 50:
-                    files_without_docstring.append(py_file.name)
+                    files_without_docstring.append(os.path.basename(py_file))
             except:
                 pass
                 
@@ -252,25 +291,17 @@ class TestCodeQuality(unittest.TestCase):
             
     def test_no_print_statements_in_production(self):
         """Test that production code doesn't have debug print statements"""
-        python_files = list(self.devtools_dir.rglob("*.py"))
+        python_files = [
+            f for f in all_py_files(str(self.devtools_dir))
+            if 'test_' not in os.path.basename(f)
+        ]
         
-        files_with_prints = []
-        for py_file in python_files:
-            if 'test_' in py_file.name or '__pycache__' in str(py_file):
-                continue
-                
-            try:
-                content = py_file.read_text(encoding='utf-8')
-                lines = content.split('\n')
-                
-                for i, line in enumerate(lines):
-                    # Look for print() not in comments or strings
-                    if 'print(' in line:
-                        stripped = line.strip()
-                        if stripped.startswith('print(') and not stripped.startswith('#'):
-                            files_with_prints.append(f"{py_file.name}:{i+1}")
-            except:
-                pass
+        with ProcessPoolExecutor() as executor:
+            files_with_prints = [
+                location
+                for locations in executor.map(_scan_prints, python_files, map(read_bytes, python_files), chunksize=4)
+                for location in locations
+            ]
                 
         # This is informational for review
         if files_with_prints:
@@ -279,15 +310,8 @@ class TestCodeQuality(unittest.TestCase):
 
 def run_advanced_tests():
     """Run all advanced tests"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestSecurityPractices))
-    suite.addTests(loader.loadTestsFromTestCase(TestConfigurationFiles))
-    suite.addTests(loader.loadTestsFromTestCase(TestDependencies))
-    suite.addTests(loader.loadTestsFromTestCase(TestDocumentationQuality))
-    suite.addTests(loader.loadTestsFromTestCase(TestCodeQuality))
+    # Create test suite
+    suite = build_suite(sys.modules[__name__])
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
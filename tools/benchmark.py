@@ -7,8 +7,10 @@ Compares Rust implementation performance across different operations
 import time
 import sys
 import os
-from typing import List, Dict, Any
-from dataclasses import dataclass, asdict
+import itertools
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from timeit import Timer
 import json
 
 # Add lib path for Rust bindings
@@ -34,33 +36,79 @@ class BenchmarkResult:
     memory_mb: float = 0.0
 
 
+# Headroom for the warmup calls made before each timed run
+WARMUP_ITERATIONS = 10
+
+# Timed repeats per auto-ranged benchmark; the fastest run is reported
+BENCHMARK_REPEATS = 5
+
+
+def random_ids(prefix: str, nbytes: int, count: int) -> List[str]:
+    """Pre-generate random hex identifiers so timed loops skip urandom/formatting"""
+    return [f"{prefix}{os.urandom(nbytes).hex()}" for _ in range(count + WARMUP_ITERATIONS)]
+
+
 class Benchmarker:
     """Performance benchmarking suite"""
     
     def __init__(self):
         self.results: List[BenchmarkResult] = []
     
-    def benchmark(self, name: str, fn, iterations: int = 1000) -> BenchmarkResult:
-        """Run a benchmark"""
+    def benchmark(self, name: str, fn, iterations: Optional[int] = None) -> BenchmarkResult:
+        """Run a benchmark
+        
+        Without a fixed iteration count the callable is calibrated like
+        benchmark_stmt. Pass iterations for callables that consume a finite
+        pre-generated pool, which must not be drained by calibration.
+        """
+        if iterations is None:
+            return self._run_autoranged(name, Timer(fn))
+        
         print(f"\n📊 {name}")
         print(f"   Running {iterations:,} iterations...")
         
         # Warmup
-        for _ in range(10):
+        for _ in range(WARMUP_ITERATIONS):
             fn()
         
+        # Actual benchmark (monotonic ns clock; repeat() avoids per-iteration ints)
+        _fn = fn
+        start = time.perf_counter_ns()
+        for _ in itertools.repeat(None, iterations):
+            _fn()
+        duration = (time.perf_counter_ns() - start) / 1e9
+        
+        return self._record(name, iterations, duration)
+    
+    def benchmark_stmt(self, name: str, stmt: str, namespace: Dict[str, Any]) -> BenchmarkResult:
+        """Run a benchmark on a statement compiled into timeit's loop (no per-call lambda frame)
+        
+        The iteration count is auto-scaled so each run takes at least 0.2s, and the
+        fastest of several repeats is kept to filter out scheduler noise.
+        """
+        return self._run_autoranged(name, Timer(stmt, globals=namespace))
+    
+    def _run_autoranged(self, name: str, timer: Timer) -> BenchmarkResult:
+        """Calibrate, warm up and time a Timer in one pass, keeping the fastest repeat"""
+        print(f"\n📊 {name}")
+        
+        # Calibrate (doubles as warmup)
+        iterations, _ = timer.autorange()
+        print(f"   Running {iterations:,} iterations x {BENCHMARK_REPEATS} repeats...")
+        
         # Actual benchmark
-        start = time.time()
-        for _ in range(iterations):
-            fn()
-        duration = time.time() - start
+        duration = min(timer.repeat(BENCHMARK_REPEATS, iterations))
         
-        ops_per_sec = iterations / duration
-        avg_latency_ms = (duration / iterations) * 1000
+        return self._record(name, iterations, duration)
+    
+    def _record(self, name: str, operations: int, duration: float) -> BenchmarkResult:
+        """Store and print a benchmark result"""
+        ops_per_sec = operations / duration
+        avg_latency_ms = (duration / operations) * 1000
         
         result = BenchmarkResult(
             name=name,
-            operations=iterations,
+            operations=operations,
             duration_seconds=duration,
             ops_per_second=ops_per_sec,
             avg_latency_ms=avg_latency_ms
@@ -76,7 +124,8 @@ class Benchmarker:
     def save_results(self, filename: str):
         """Save results to JSON"""
         with open(filename, 'w') as f:
-            json.dump([asdict(r) for r in self.results], f, indent=2)
+            # BenchmarkResult is flat, so its __dict__ serializes as-is (no asdict deepcopy)
+            f.write(json.dumps([r.__dict__ for r in self.results], indent=2))
         print(f"\n💾 Results saved to {filename}")
 
 
@@ -90,33 +139,35 @@ def main():
     
     # VRF Benchmarks
     vrf = axx.PyVRF()
-    data_small = list(b"x" * 64)
-    data_medium = list(b"x" * 1024)
-    data_large = list(b"x" * 1024 * 10)
+    # Pass bytes straight through; PyO3 reads them as a buffer, not int-by-int
+    data_small = b"x" * 64
+    data_medium = b"x" * 1024
+    data_large = b"x" * 1024 * 10
     
-    benchmarker.benchmark(
+    benchmarker.benchmark_stmt(
         "VRF Proof (64 bytes)",
-        lambda: vrf.prove(data_small),
-        iterations=10000
+        "vrf.prove(data)",
+        {"vrf": vrf, "data": data_small}
     )
     
-    benchmarker.benchmark(
+    benchmarker.benchmark_stmt(
         "VRF Proof (1 KB)",
-        lambda: vrf.prove(data_medium),
-        iterations=5000
+        "vrf.prove(data)",
+        {"vrf": vrf, "data": data_medium}
     )
     
-    benchmarker.benchmark(
+    benchmarker.benchmark_stmt(
         "VRF Proof (10 KB)",
-        lambda: vrf.prove(data_large),
-        iterations=1000
+        "vrf.prove(data)",
+        {"vrf": vrf, "data": data_large}
     )
     
     # Validator Benchmarks
+    # Creation is stateless, so IDs can repeat and the run can be auto-ranged
+    addresses = itertools.cycle(random_ids("0x", 20, 50000))
     benchmarker.benchmark(
         "Validator Creation",
-        lambda: axx.PyValidator(f"0x{os.urandom(20).hex()}", 1000000),
-        iterations=50000
+        lambda: axx.PyValidator(next(addresses), 1000000)
     )
     
     # Consensus Benchmarks
@@ -125,55 +176,60 @@ def main():
     for v in validators:
         engine.register_validator(v)
     
+    validator_ids = iter(random_ids("v", 8, 1000))
     benchmarker.benchmark(
         "Validator Registration",
-        lambda: engine.register_validator(axx.PyValidator(f"v{os.urandom(8).hex()}", 100000)),
+        lambda: engine.register_validator(axx.PyValidator(next(validator_ids), 100000)),
         iterations=1000
     )
     
+    job_ids = iter(random_ids("job_", 8, 5000))
     benchmarker.benchmark(
         "Challenge Generation",
-        lambda: engine.generate_challenge(f"job_{os.urandom(8).hex()}", 1000),
+        lambda: engine.generate_challenge(next(job_ids), 1000),
         iterations=5000
     )
     
-    benchmarker.benchmark(
+    benchmarker.benchmark_stmt(
         "Fraud Probability Calculation",
-        lambda: axx.PyConsensusEngine.fraud_probability(0.1, 100),
-        iterations=100000
+        "fraud_probability(0.1, 100)",
+        {"fraud_probability": axx.PyConsensusEngine.fraud_probability}
     )
     
     # Blockchain Benchmarks
     blockchain = axx.PyBlockchain()
     
-    benchmarker.benchmark(
+    benchmarker.benchmark_stmt(
         "Get Block by Number",
-        lambda: blockchain.get_block(0),
-        iterations=10000
+        "blockchain.get_block(0)",
+        {"blockchain": blockchain}
     )
     
-    benchmarker.benchmark(
+    benchmarker.benchmark_stmt(
         "Get Latest Block Number",
-        lambda: blockchain.latest_block_number(),
-        iterations=50000
+        "blockchain.latest_block_number()",
+        {"blockchain": blockchain}
     )
     
     # Transaction Benchmarks
+    senders = itertools.cycle(random_ids("0x", 20, 50000))
+    recipients = itertools.cycle(random_ids("0x", 20, 50000))
     benchmarker.benchmark(
         "Transaction Creation",
         lambda: axx.PyTransaction(
-            f"0x{os.urandom(20).hex()}",
-            f"0x{os.urandom(20).hex()}",
+            next(senders),
+            next(recipients),
             100,
             []
-        ),
-        iterations=50000
+        )
     )
     
     # Complex Operations
+    flow_job_ids = iter(random_ids("job_", 8, 1000))
+    
     def complex_consensus_flow():
         """Simulate a full consensus flow"""
-        job_id = f"job_{os.urandom(8).hex()}"
+        job_id = next(flow_job_ids)
         challenge = engine.generate_challenge(job_id, 1000)
         prob = axx.PyConsensusEngine.fraud_probability(0.05, challenge.sample_size)
         return prob
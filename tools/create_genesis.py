@@ -4,10 +4,12 @@ Genesis Configuration Generator
 Creates genesis.json for axionax Testnet launch
 """
 
+import hashlib
 import json
 import sys
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import List, Dict, Any
+
 
 class GenesisGenerator:
     def __init__(self, chain_id: int = 86137):
@@ -82,15 +84,19 @@ class GenesisGenerator:
         if not address.startswith("0x"):
             address = f"0x{address}"
         
+        self.genesis["alloc"][address] = self._allocation_entry(balance, vesting, vesting_schedule)
+        print(f"Added allocation: {address} = {balance} wei")
+    
+    @staticmethod
+    def _allocation_entry(balance: str, vesting: bool, vesting_schedule: str) -> Dict[str, Any]:
+        """Build an alloc entry, with a vesting block when enabled"""
         alloc = {"balance": balance}
         if vesting:
             alloc["vesting"] = {
                 "enabled": True,
                 "schedule": vesting_schedule
             }
-        
-        self.genesis["alloc"][address] = alloc
-        print(f"Added allocation: {address} = {balance} wei")
+        return alloc
     
     def add_contract(self, address: str, bytecode: str, storage: Dict = None):
         """Add pre-deployed contract"""
@@ -127,13 +133,13 @@ class GenesisGenerator:
         with open(filepath, 'r') as f:
             allocations = json.load(f)
         
-        for alloc in allocations:
-            self.add_allocation(
-                address=alloc["address"],
-                balance=alloc["balance"],
-                vesting=alloc.get("vesting", False),
-                vesting_schedule=alloc.get("vesting_schedule", "")
-            )
+        # Build all entries in one pass and merge them with a single update;
+        # per-entry add_allocation calls (and prints) dominate large presale lists
+        self.genesis["alloc"].update({
+            (a["address"] if a["address"].startswith("0x") else f"0x{a['address']}"):
+                self._allocation_entry(a["balance"], a.get("vesting", False), a.get("vesting_schedule", ""))
+            for a in allocations
+        })
         print(f"Loaded {len(allocations)} allocations from {filepath}")
     
     def validate(self) -> bool:
@@ -148,10 +154,8 @@ class GenesisGenerator:
             errors.append("Warning: Less than 3 validators (not recommended)")
         
         # Check allocations
-        total_supply = 0
-        for addr, alloc in self.genesis["alloc"].items():
-            if "balance" in alloc:
-                total_supply += int(alloc["balance"], 16 if alloc["balance"].startswith("0x") else 10)
+        balances = (alloc["balance"] for alloc in self.genesis["alloc"].values() if "balance" in alloc)
+        total_supply = sum(int(b, 16 if b.startswith("0x") else 10) for b in balances)
         
         print(f"\nValidation Results:")
         print(f"  Validators: {len(self.genesis['validators'])}")
@@ -169,14 +173,14 @@ class GenesisGenerator:
     
     def save(self, filepath: str = "genesis.json"):
         """Save genesis to file"""
-        with open(filepath, 'w') as f:
-            json.dump(self.genesis, f, indent=2)
-        print(f"\n✅ Genesis saved to: {filepath}")
+        data = json.dumps(self.genesis, indent=2).encode()
         
-        # Calculate and print hash
-        import hashlib
-        with open(filepath, 'rb') as f:
-            genesis_hash = hashlib.sha256(f.read()).hexdigest()
+        # Hash the exact bytes being written instead of re-reading the file
+        genesis_hash = hashlib.sha256(data).hexdigest()
+        
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        print(f"\n✅ Genesis saved to: {filepath}")
         print(f"📝 Genesis Hash: 0x{genesis_hash}")
         return genesis_hash
 
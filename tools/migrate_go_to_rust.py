@@ -4,18 +4,121 @@ Migration tool: Go implementation → Rust/Python implementation
 Handles data migration, state transfer, and validation
 """
 
+import base64
 import json
 import os
 import sys
 import hashlib
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 
 # Add lib path for Rust bindings
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'deai', 'lib'))
 import axionax_python as axx
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Files copied concurrently when backing up the Go data directory
+BACKUP_COPY_WORKERS = 8
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them exactly
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def dumps_json_compact(obj: Any) -> bytes:
+    """Serialize to canonical compact UTF-8 JSON bytes (sorted keys), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them exactly
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes with stdlib json
+    
+    orjson is deliberately not used for input: it turns integers beyond 64
+    bits into floats, and wei amounts and balances routinely exceed that.
+    """
+    return json.loads(data)
+
+
+def _copy_tree(src: str, dst: str):
+    """Copy a directory tree with shutil.copytree semantics, copying files in parallel threads"""
+    with ThreadPoolExecutor(max_workers=BACKUP_COPY_WORKERS) as executor:
+        futures = []
+        
+        def submit_copy(file_src: str, file_dst: str) -> str:
+            futures.append(executor.submit(shutil.copy2, file_src, file_dst))
+            return file_dst
+        
+        # copytree still walks the tree, follows directory symlinks and refuses
+        # an existing target; only the per-file copies are handed to the pool
+        shutil.copytree(src, dst, copy_function=submit_copy)
+        for future in futures:
+            future.result()
+    
+    # The queued copies land after copytree stamped each directory, so
+    # re-apply directory metadata bottom-up once every file is in place
+    for dirpath, _, _ in os.walk(src, topdown=False, followlinks=True):
+        shutil.copystat(dirpath, os.path.join(dst, os.path.relpath(dirpath, src)))
+
+
+def _tx_data(data: Any) -> bytes:
+    """Normalize transaction data to bytes, which PyO3 takes as &[u8] without copying into a list
+    
+    0x-prefixed strings are hex. Any other string is base64, which is how
+    Go's encoding/json marshals []byte; both are decoded strictly and raise
+    on malformed input.
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        if data.startswith(('0x', '0X')):
+            return bytes.fromhex(data[2:])
+        return base64.b64decode(data, validate=True)
+    return bytes(data)
+
+
+def _convert_block_chunk(blocks: List[Dict[str, Any]]) -> List[tuple]:
+    """Convert a chunk of Go blocks into (number, transaction tuples) pairs
+    
+    A block that cannot be converted aborts the migration: skipping it would
+    leave a gap and shift the height of every later block.
+    """
+    converted = []
+    for block in blocks:
+        try:
+            converted.append((block.get('number', 0), [
+                (tx.get('from', ''), tx.get('to', ''), int(tx.get('amount', 0)), _tx_data(tx.get('data', b'')))
+                for tx in block.get('transactions', [])
+            ]))
+        except Exception as e:
+            raise RuntimeError(f"Failed to migrate block {block.get('number')}: {e}") from e
+    return converted
+
 
 @dataclass
 class MigrationConfig:
@@ -24,6 +127,9 @@ class MigrationConfig:
     rust_data_dir: str
     backup_dir: str
     validate_after_migration: bool = True
+    # Not wired up: conversion is a few dict lookups per transaction, cheaper
+    # than pickling blocks to worker processes and back, and PyTransaction
+    # construction and insertion must stay in the process owning the chain
     parallel_migration: bool = False
     chunk_size: int = 1000
 
@@ -51,34 +157,54 @@ class GoDataReader:
         self.blockchain_file = os.path.join(data_dir, "blockchain.json")
         self.validators_file = os.path.join(data_dir, "validators.json")
         self.state_file = os.path.join(data_dir, "state.json")
-    
-    def read_blockchain(self) -> List[Dict[str, Any]]:
-        """Read blockchain data from Go format"""
-        if not os.path.exists(self.blockchain_file):
-            return []
         
-        with open(self.blockchain_file, 'r') as f:
-            data = json.load(f)
+        # Parsed once and shared between the migrate and validate stages
+        self._validators_cache: Optional[List[Dict[str, Any]]] = None
+        self._state_cache: Optional[Dict[str, Any]] = None
+    
+    def read_blockchain(self) -> Iterator[Dict[str, Any]]:
+        """Stream blocks from Go format one at a time
         
-        return data.get('blocks', [])
+        With ijson installed only one block is held in memory; otherwise the
+        whole file is parsed up front and blocks are yielded from it, sorted
+        by number only if an O(n) check finds them out of order.
+        """
+        if not os.path.exists(self.blockchain_file):
+            return
+        
+        with open(self.blockchain_file, 'rb') as f:
+            if IJSON_AVAILABLE:
+                yield from ijson.items(f, 'blocks.item')
+                return
+            blocks = loads_json(f.read()).get('blocks', [])
+        
+        numbers = [b.get('number', 0) for b in blocks]
+        if all(a <= b for a, b in zip(numbers, numbers[1:])):
+            yield from blocks
+        else:
+            yield from (blocks[i] for i in sorted(range(len(blocks)), key=numbers.__getitem__))
     
     def read_validators(self) -> List[Dict[str, Any]]:
-        """Read validator data from Go format"""
-        if not os.path.exists(self.validators_file):
-            return []
-        
-        with open(self.validators_file, 'r') as f:
-            data = json.load(f)
+        """Read validator data from Go format (parsed once, then cached)"""
+        if self._validators_cache is None:
+            if not os.path.exists(self.validators_file):
+                self._validators_cache = []
+            else:
+                with open(self.validators_file, 'rb') as f:
+                    self._validators_cache = loads_json(f.read()).get('validators', [])
         
-        return data.get('validators', [])
+        return self._validators_cache
     
     def read_state(self) -> Dict[str, Any]:
-        """Read state data from Go format"""
-        if not os.path.exists(self.state_file):
-            return {}
+        """Read state data from Go format (parsed once, then cached)"""
+        if self._state_cache is None:
+            if not os.path.exists(self.state_file):
+                self._state_cache = {}
+            else:
+                with open(self.state_file, 'rb') as f:
+                    self._state_cache = loads_json(f.read())
         
-        with open(self.state_file, 'r') as f:
-            return json.load(f)
+        return self._state_cache
 
 
 class RustDataWriter:
@@ -113,63 +239,107 @@ class RustDataWriter:
         
         return count
     
-    def migrate_blocks(self, go_blocks: List[Dict[str, Any]]) -> tuple[int, int]:
-        """Migrate blocks from Go to Rust"""
+    def migrate_blocks(self, go_blocks: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> tuple[int, int]:
+        """Migrate blocks from Go to Rust
+        
+        Blocks are consumed as a stream and must arrive in ascending block
+        number order (as written by the Go exporter); sorting would force the
+        whole chain into memory, so out-of-order input aborts. Converted blocks are inserted ``chunk_size``
+        at a time so the FFI boundary is crossed once per chunk.
+        """
         blocks_count = 0
         txs_count = 0
+        for chunk in map(_convert_block_chunk, self._chunk_blocks(go_blocks, chunk_size)):
+            numbers = []
+            batch = []
+            for number, txs in chunk:
+                try:
+                    batch.append([axx.PyTransaction(from_addr=f, to=t, amount=a, data=d) for f, t, a, d in txs])
+                except Exception as e:
+                    raise RuntimeError(f"Failed to migrate block {number}: {e}") from e
+                numbers.append(number)
+            blocks, txs = self._add_blocks(numbers, batch)
+            blocks_count += blocks
+            txs_count += txs
         
-        # Sort blocks by number
-        sorted_blocks = sorted(go_blocks, key=lambda b: b.get('number', 0))
+        return blocks_count, txs_count
+    
+    @staticmethod
+    def _chunk_blocks(go_blocks: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Group the block stream into lists of chunk_size, skipping genesis"""
+        chunk = []
+        last_number = -1
+        for block in go_blocks:
+            number = block.get('number', 0)
+            if number < last_number:
+                # Inserting out of order would shift every later height: stop the migration
+                raise RuntimeError(f"Block {number} arrived after block {last_number}; input is not ordered")
+            last_number = number
+            
+            # Skip genesis (already created)
+            if number == 0:
+                continue
+            
+            chunk.append(block)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def _add_blocks(self, numbers: List[int], batch: List[List[Any]]) -> tuple[int, int]:
+        """Insert a chunk of converted blocks, returning (blocks, txs) added"""
+        # Single FFI call when the bindings expose the batch API
+        if hasattr(self.blockchain, 'add_blocks'):
+            try:
+                self.blockchain.add_blocks(batch)
+            except Exception as e:
+                # The batch may have been partially applied, and appending later
+                # chunks would leave a gap and shift heights: stop the migration
+                raise RuntimeError(f"Failed to migrate blocks {numbers[0]}-{numbers[-1]}: {e}") from e
+            return len(batch), sum(len(txs) for txs in batch)
         
-        for block in sorted_blocks:
+        blocks_count = 0
+        txs_count = 0
+        for number, transactions in zip(numbers, batch):
             try:
-                # Skip genesis (already created)
-                if block.get('number', 0) == 0:
-                    continue
-                
-                # Convert transactions
-                transactions = []
-                for tx in block.get('transactions', []):
-                    rust_tx = axx.PyTransaction(
-                        from_addr=tx.get('from', ''),
-                        to=tx.get('to', ''),
-                        amount=int(tx.get('amount', 0)),
-                        data=list(tx.get('data', b''))
-                    )
-                    transactions.append(rust_tx)
-                    txs_count += 1
-                
-                # Add block
                 self.blockchain.add_block(transactions)
-                blocks_count += 1
-                
             except Exception as e:
-                print(f"Warning: Failed to migrate block {block.get('number')}: {e}")
-        
+                raise RuntimeError(f"Failed to migrate block {number}: {e}") from e
+            blocks_count += 1
+            txs_count += len(transactions)
         return blocks_count, txs_count
     
-    def migrate_state(self, go_state: Dict[str, Any]) -> int:
+    def migrate_state(self, go_state: Dict[str, Any], chunk_size: int = 1000) -> int:
         """
         Migrate state data directly into Rust's state database via PyO3 bindings.
         Falls back to JSON dump if direct binding is not available.
         """
         # This assumes a PyStateDB object is exposed via PyO3
-        # with a `set(key, value)` method.
+        # with a `set(key, value)` method, and optionally `set_batch(items)`.
         count = 0
         try:
             # Example: self.blockchain.state_db() returns the state DB object
             state_db = self.blockchain.state_db() 
             print("   -> Using direct state migration via Rust bindings.")
-            for key, value in go_state.items():
-                # Assuming the state DB binding accepts string key and JSON-encoded string value
-                state_db.set(key, json.dumps(value))
-                count += 1
+            if hasattr(state_db, 'set_batch'):
+                # Pre-serialize each chunk and hand it over in one FFI call
+                items = iter(go_state.items())
+                while chunk := list(islice(items, chunk_size)):
+                    state_db.set_batch([(key, dumps_json_compact(value)) for key, value in chunk])
+                    count += len(chunk)
+            else:
+                for key, value in go_state.items():
+                    # Assuming the state DB binding accepts string key and JSON-encoded string value
+                    state_db.set(key, json.dumps(value))
+                    count += 1
         except (AttributeError, NotImplementedError):
             print("   -> Warning: Direct state migration not available. Falling back to JSON dump.")
-            # Fallback to JSON dump if direct binding is not implemented
-            state_file = os.path.join(self.data_dir, "migrated_state.json")
-            with open(state_file, 'w') as f:
-                json.dump(go_state, f, indent=2)
+            # Fallback to a JSONL dump (one {key: value} object per line) if
+            # direct binding is not implemented, so it can be read back as a stream
+            state_file = os.path.join(self.data_dir, "migrated_state.jsonl")
+            with open(state_file, 'wb') as f:
+                f.writelines(dumps_json_compact({key: value}) + b"\n" for key, value in go_state.items())
             return len(go_state)
         
         return count
@@ -182,91 +352,121 @@ class MigrationValidator:
         self.go_reader = go_reader
         self.rust_writer = rust_writer
     
-    def validate_blockchain(self) -> tuple[bool, List[str]]:
-        """Validate blockchain migration"""
+    def validate_blockchain(self, go_blocks: Optional[Iterable[Dict[str, Any]]] = None) -> tuple[bool, List[str]]:
+        """Validate blockchain migration against a fresh stream of Go blocks"""
+        if go_blocks is None:
+            go_blocks = self.go_reader.read_blockchain()
         errors = []
         
-        go_blocks = self.go_reader.read_blockchain()
-        rust_height = self.rust_writer.blockchain.height()
-        
-        # Check block count (including genesis)
-        expected_height = len(go_blocks)
-        if rust_height != expected_height:
-            errors.append(f"Block count mismatch: expected {expected_height}, got {rust_height}")
-        
-        # Validate each block
+        blockchain = self.rust_writer.blockchain
+        rust_height = blockchain.height()
+        
+        # Fetch (number, tx_count) for the whole chain in one FFI call when
+        # the bindings support it, instead of one get_block call per block.
+        # get_tx_counts is indexed by height, so block numbers are implied.
+        if hasattr(blockchain, 'get_blocks_summary'):
+            summary = blockchain.get_blocks_summary()
+        elif hasattr(blockchain, 'get_tx_counts'):
+            summary = list(enumerate(blockchain.get_tx_counts()))
+        else:
+            summary = None
+        
+        # Validate each block while streaming, counting as we go
+        expected_height = 0
         for i, go_block in enumerate(go_blocks):
-            rust_block = self.rust_writer.blockchain.get_block(i)
-            
-            if rust_block is None:
-                errors.append(f"Block {i} not found in Rust blockchain")
-                continue
+            expected_height += 1
+            if summary is not None:
+                if i >= len(summary):
+                    errors.append(f"Block {i} not found in Rust blockchain")
+                    continue
+                rust_number, rust_txs = summary[i]
+            else:
+                rust_block = blockchain.get_block(i)
+                if rust_block is None:
+                    errors.append(f"Block {i} not found in Rust blockchain")
+                    continue
+                rust_number, rust_txs = rust_block.number, rust_block.transactions_count
             
             # Validate block number
-            if rust_block.number != go_block.get('number', 0):
+            if rust_number != go_block.get('number', 0):
                 errors.append(f"Block {i} number mismatch")
             
             # Validate transaction count
             expected_txs = len(go_block.get('transactions', []))
-            if rust_block.transactions_count != expected_txs:
+            if rust_txs != expected_txs:
                 errors.append(f"Block {i} transaction count mismatch")
         
+        # Check block count (including genesis)
+        if rust_height != expected_height:
+            errors.insert(0, f"Block count mismatch: expected {expected_height}, got {rust_height}")
+        
         return len(errors) == 0, errors
     
-    def validate_validators(self) -> tuple[bool, List[str]]:
+    def validate_validators(self, go_validators: Optional[List[Dict[str, Any]]] = None) -> tuple[bool, List[str]]:
         """Validate validator migration"""
         errors = []
         
-        go_validators = self.go_reader.read_validators()
+        if go_validators is None:
+            go_validators = self.go_reader.read_validators()
         rust_validators = self.rust_writer.consensus.get_validators()
         
         # Check count
         if len(rust_validators) != len(go_validators):
             errors.append(f"Validator count mismatch: expected {len(go_validators)}, got {len(rust_validators)}")
         
-        # Validate each validator
-        go_addrs = {v['address'] for v in go_validators}
+        # Validate each validator in a single pass against the Rust address set
         rust_addrs = {v.address for v in rust_validators}
-        
-        missing = go_addrs - rust_addrs
+        missing = {v['address'] for v in go_validators if v['address'] not in rust_addrs}
         if missing:
             errors.append(f"Missing validators: {missing}")
         
         return len(errors) == 0, errors
     
-    def validate_state(self) -> tuple[bool, List[str]]:
+    def validate_state(self, go_state: Optional[Dict[str, Any]] = None) -> tuple[bool, List[str]]:
         """Validate state migration"""
         errors = []
-        go_state = self.go_reader.read_state()
+        if go_state is None:
+            go_state = self.go_reader.read_state()
 
         # Try to validate directly from Rust's state DB first
         try:
             state_db = self.rust_writer.blockchain.state_db()
             print("   -> Validating state directly from Rust DB.")
+            get_raw = getattr(state_db, 'get_raw', None)
             for key, go_value in go_state.items():
-                rust_value_json = state_db.get(key)
+                if get_raw is not None:
+                    # Values written by set_batch are canonical bytes, so equal
+                    # bytes mean equal values without decoding either side
+                    rust_value_json = get_raw(key)
+                    if rust_value_json is not None and rust_value_json == dumps_json_compact(go_value):
+                        continue
+                else:
+                    rust_value_json = state_db.get(key)
+                
                 if rust_value_json is None:
                     errors.append(f"State key missing in Rust DB: {key}")
                     continue
                 
-                rust_value = json.loads(rust_value_json)
+                rust_value = loads_json(rust_value_json)
                 if rust_value != go_value:
                     errors.append(f"State value mismatch for key: {key}")
 
         except (AttributeError, NotImplementedError):
             # Fallback to validating the JSON file if direct access is not available
             print("   -> Direct state validation not available. Falling back to JSON file.")
-            state_file = os.path.join(self.rust_writer.data_dir, "migrated_state.json")
+            state_file = os.path.join(self.rust_writer.data_dir, "migrated_state.jsonl")
             if not os.path.exists(state_file):
-                errors.append("Migrated state file (migrated_state.json) not found for validation.")
+                errors.append("Migrated state file (migrated_state.jsonl) not found for validation.")
                 return False, errors
             
-            with open(state_file, 'r') as f:
-                rust_state = json.load(f)
+            rust_keys = set()
+            with open(state_file, 'rb') as f:
+                for line in f:
+                    rust_keys.update(loads_json(line))
             
-            if set(go_state.keys()) != set(rust_state.keys()):
-                missing = set(go_state.keys()) - set(rust_state.keys())
-                extra = set(rust_state.keys()) - set(rust_state.keys())
+            if rust_keys != go_state.keys():
+                missing = go_state.keys() - rust_keys
+                extra = rust_keys - go_state.keys()
                 errors.append(f"State key mismatch. Missing: {missing}, Extra: {extra}")
 
         return len(errors) == 0, errors
@@ -287,11 +487,10 @@ class MigrationManager:
     def backup_go_data(self) -> bool:
         """Backup Go data before migration"""
         try:
-            import shutil
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = os.path.join(self.config.backup_dir, f"go_data_{timestamp}")
             
-            shutil.copytree(self.config.go_data_dir, backup_path)
+            _copy_tree(self.config.go_data_dir, backup_path)
             print(f"✅ Backup created: {backup_path}")
             return True
             
@@ -324,13 +523,13 @@ class MigrationManager:
         # Step 3: Migrate blockchain
         print("\n⛓️  Step 3: Migrating blockchain...")
         go_blocks = self.go_reader.read_blockchain()
-        blocks_migrated, txs_migrated = self.rust_writer.migrate_blocks(go_blocks)
+        blocks_migrated, txs_migrated = self.rust_writer.migrate_blocks(go_blocks, self.config.chunk_size)
         print(f"   Migrated {blocks_migrated} blocks, {txs_migrated} transactions")
         
         # Step 4: Migrate state
         print("\n💾 Step 4: Migrating state...")
         go_state = self.go_reader.read_state()
-        state_entries = self.rust_writer.migrate_state(go_state)
+        state_entries = self.rust_writer.migrate_state(go_state, self.config.chunk_size)
         print(f"   Migrated {state_entries} state entries")
         
         # Step 5: Validation
@@ -338,21 +537,21 @@ class MigrationManager:
         if self.config.validate_after_migration:
             print("\n✅ Step 5: Validating migration...")
             
-            blockchain_valid, blockchain_errors = self.validator.validate_blockchain()
+            blockchain_valid, blockchain_errors = self.validator.validate_blockchain(self.go_reader.read_blockchain())
             if not blockchain_valid:
                 errors.extend(blockchain_errors)
                 validation_passed = False
             else:
                 print("   ✓ Blockchain validation passed")
             
-            validators_valid, validator_errors = self.validator.validate_validators()
+            validators_valid, validator_errors = self.validator.validate_validators(go_validators)
             if not validators_valid:
                 errors.extend(validator_errors)
                 validation_passed = False
             else:
                 print("   ✓ Validators validation passed")
             
-            state_valid, state_errors = self.validator.validate_state()
+            state_valid, state_errors = self.validator.validate_state(go_state)
             if not state_valid:
                 errors.extend(state_errors)
                 validation_passed = False
@@ -378,8 +577,8 @@ class MigrationManager:
         
         # Save report
         report_file = os.path.join(self.config.rust_data_dir, "migration_report.json")
-        with open(report_file, 'w') as f:
-            json.dump(asdict(report), f, indent=2)
+        with open(report_file, 'wb') as f:
+            f.write(dumps_json(report.__dict__))
         
         print(f"\n{'✅' if validation_passed else '❌'} Migration completed in {duration:.2f}s")
         print(f"   Report saved: {report_file}")